@@ -1,11 +1,13 @@
+import os
 import sys
 import json 
+import logging
+from collections import OrderedDict
 from datetime import datetime
 
 import numpy as np
 import pyperclip as pc
-from PIL import ImageGrab
-from dotenv import load_dotenv
+from dotenv import dotenv_values, load_dotenv
 
 from PyQt5 import QtWidgets, QtCore, QtGui
 from PyQt5.QtCore import Qt, QRect, QPoint
@@ -18,9 +20,26 @@ from PyQt5.QtGui import QPixmap, QImage, QPainter, QFont
 
 from ocr_processor import GeminiOCR
 from ocr_processor_tessaract import TesseractOCR
+from ocr_scheduler import OCRScheduler
 from path_manager import PathManager
 
-load_dotenv()
+load_dotenv(interpolate=False)
+
+logger = logging.getLogger(__name__)
+
+# (display name, Tesseract language code) pairs offered in the settings tab
+LANGUAGES = (
+    ('English', 'eng'),
+    ('Bangla', 'ben'),
+    ('Hindi', 'hin'),
+    ('Japanese', 'jpn'),
+    ('Spanish', 'spa'),
+    ('French', 'fra'),
+    ('German', 'deu'),
+    ('Chinese (Simplified)', 'chi_sim'),
+    ('Russian', 'rus'),
+    ('Arabic', 'ara'),
+)
 
 
 class ConfigManager:
@@ -35,25 +54,24 @@ class ConfigManager:
 
     def load(self):
         """Load .env variables into self.config."""
-        try:
-            with open(self.env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        self.config[key.strip()] = value.strip()
-        except FileNotFoundError:
-            # If no .env file yet, it's okay.
-            pass
+        # A missing .env file just yields no values; keys without a value are skipped.
+        # Interpolation is off so values read back exactly as save() wrote them.
+        self.config = {
+            key: value
+            for key, value in dotenv_values(self.env_file, interpolate=False).items()
+            if value is not None
+        }
 
     def save(self):
         """Write the current config dictionary to the .env file."""
         try:
             with open(self.env_file, 'w') as f:
                 for key, value in self.config.items():
-                    f.write(f"{key}={value}\n")
+                    # Single-quote values so '#', quotes and spaces survive a reload
+                    escaped = value.replace('\\', '\\\\').replace("'", "\\'")
+                    f.write(f"{key}='{escaped}'\n")
         except Exception as e:
-            print("Error saving .env file:", e)
+            logger.error("Error saving .env file: %s", e)
 
     def get(self, key, default=None):
         return self.config.get(key, default)
@@ -62,6 +80,12 @@ class ConfigManager:
         self.config[key] = str(value)
         self.save()
 
+    def set_many(self, values):
+        """Update several keys and write the .env file once."""
+        for key, value in values.items():
+            self.config[key] = str(value)
+        self.save()
+
 
 class SnippingWidget(QtWidgets.QWidget):
     """
@@ -71,6 +95,9 @@ class SnippingWidget(QtWidgets.QWidget):
     num_snip = 0
     is_snipping = False
     background = True
+    min_snip_size = 3
+    # (snippet time, extracted text)
+    text_extracted = QtCore.pyqtSignal(str, str)
 
     def __init__(self, parent=None):
         super().__init__()
@@ -86,6 +113,15 @@ class SnippingWidget(QtWidgets.QWidget):
         self.tesseract_path = self.path_manager.get_tesseract_path
         self.gemini_api_key = self.path_manager.get_gemini_api_key
 
+        # OCR engines are expensive to build, so keep one scheduler per (engine, path)
+        self._engines = {}
+        self.text_extracted.connect(self.handle_extracted_text)
+        self._bind_ocr_call()
+
+        # Snips are timestamped on submission; a counter keeps same-second snips apart
+        self._last_snip_time = None
+        self._snip_sequence = 0
+
         # Get screen geometry via PyQt
         screen = QApplication.primaryScreen()
         screen_geometry = screen.geometry()
@@ -95,6 +131,10 @@ class SnippingWidget(QtWidgets.QWidget):
         self.begin = QPoint()
         self.end = QPoint()
 
+        # Selection rectangle style never changes, so build it once
+        self._pen = QtGui.QPen(QtGui.QColor('black'), 3)
+        self._brush = QtGui.QBrush(QtGui.QColor(128, 128, 255, 100))
+
     def start(self):
         """Start the snipping process."""
         if self.parent:
@@ -104,7 +144,7 @@ class SnippingWidget(QtWidgets.QWidget):
         SnippingWidget.is_snipping = True
         self.setWindowOpacity(0.3)
         QtWidgets.QApplication.setOverrideCursor(QtGui.QCursor(QtCore.Qt.CrossCursor))
-        print('Capture the screen... Press Q to quit.')
+        logger.debug('Capture the screen... Press Q to quit.')
         self.showFullScreen()
         self.show()
 
@@ -112,21 +152,14 @@ class SnippingWidget(QtWidgets.QWidget):
         """
         Draw the selection rectangle while snipping.
         """
-        if SnippingWidget.is_snipping:
-            brush_color = (128, 128, 255, 100)
-            line_width = 3
-            opacity = 0.3
-        else:
+        if not SnippingWidget.is_snipping:
             self.begin = QPoint()
             self.end = QPoint()
-            brush_color = (0, 0, 0, 0)
-            line_width = 0
-            opacity = 0
+            return
 
-        self.setWindowOpacity(opacity)
         qp = QtGui.QPainter(self)
-        qp.setPen(QtGui.QPen(QtGui.QColor('black'), line_width))
-        qp.setBrush(QtGui.QColor(*brush_color))
+        qp.setPen(self._pen)
+        qp.setBrush(self._brush)
         rect = QtCore.QRectF(self.begin, self.end)
         qp.drawRect(rect)
 
@@ -135,7 +168,7 @@ class SnippingWidget(QtWidgets.QWidget):
         Press 'Q' to quit snipping without capturing.
         """
         if event.key() == QtCore.Qt.Key_Q:
-            print('Quit snipping.')
+            logger.debug('Quit snipping.')
             self.close()
         event.accept()
 
@@ -145,59 +178,155 @@ class SnippingWidget(QtWidgets.QWidget):
         self.update()
 
     def mouseMoveEvent(self, event):
-        self.end = event.pos()
-        self.update()
+        prev_end = self.end
+        end = event.pos()
+        if (end - prev_end).manhattanLength() < 2:
+            return
+        self.end = end
+        # Repaint only the area covered by the old and new selection
+        dirty_rect = QRect(self.begin, prev_end).normalized().united(
+            QRect(self.begin, self.end).normalized())
+        self.update(dirty_rect.adjusted(-4, -4, 4, 4))
 
     def mouseReleaseEvent(self, event):
         """
         On mouse release, capture the selected region and run OCR.
         """
         SnippingWidget.is_snipping = False
+        self.setWindowOpacity(0)
+        # Pick up any final movement skipped by the move throttle
+        self.end = event.pos()
 
-        x1 = min(self.begin.x(), self.end.x())
-        y1 = min(self.begin.y(), self.end.y())
-        x2 = max(self.begin.x(), self.end.x())
-        y2 = max(self.begin.y(), self.end.y())
+        # QRect(QPoint, QPoint) includes both corners, so trim it to the dragged size
+        rect = QRect(self.begin, self.end).normalized().adjusted(0, 0, -1, -1)
 
         self.repaint()
 
-        img = ImageGrab.grab(bbox=(x1, y1, x2, y2))
+        if rect.width() < SnippingWidget.min_snip_size or rect.height() < SnippingWidget.min_snip_size:
+            # A click or tiny drag is not a selection, so there is nothing to OCR
+            logger.debug("Selection too small, skipping OCR.")
+        else:
+            snippet_time = self._next_snip_time()
+            # Grab only the selected region straight from the display server. grabWindow
+            # takes logical coordinates and returns device pixels, so HiDPI needs no scaling.
+            try:
+                screen = QApplication.primaryScreen()
+                pixmap = screen.grabWindow(0, rect.x(), rect.y(), rect.width(), rect.height())
+                if pixmap.isNull():
+                    raise RuntimeError("Screen capture failed")
+                img_np = self.convert_qimage_to_numpy(pixmap.toImage())
+                future = self._ocr_call(img_np)
+                # Runs on a worker thread; the signal hands the text back to the UI thread
+                future.add_done_callback(lambda f: self._on_ocr_done(f, snippet_time))
+            except Exception as e:
+                logger.error("Error during OCR: %s", e)
+                self.text_extracted.emit(snippet_time, "")
+
+        if self.parent:
+            self.parent.show()
+            self.parent.raise_()
+            self.parent.activateWindow()
+        self.hide()
 
+    @staticmethod
+    def convert_qimage_to_numpy(qimg):
+        """
+        Convert a QImage to an RGB NumPy array.
+        """
+        qimg = qimg.convertToFormat(QImage.Format_RGB888)
+        width, height = qimg.width(), qimg.height()
+        bytes_per_line = qimg.bytesPerLine()
+        buffer = qimg.constBits().asstring(bytes_per_line * height)
+        # Scan lines are padded to 32-bit boundaries, so strip the padding per row
+        img_np = np.frombuffer(buffer, dtype=np.uint8).reshape(height, bytes_per_line)
+        return img_np[:, :width * 3].reshape(height, width, 3)
+
+    def _next_snip_time(self):
+        """
+        Return a unique time key for a new snip, suffixing a counter when several
+        snips are taken within the same second.
+        """
+        snippet_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if snippet_time == self._last_snip_time:
+            self._snip_sequence += 1
+            return f"{snippet_time} ({self._snip_sequence})"
+        self._last_snip_time = snippet_time
+        self._snip_sequence = 1
+        return snippet_time
+
+    def _on_ocr_done(self, future, snippet_time):
+        if future.cancelled():
+            # Not an OCR result; this runs synchronously inside terminate() on the UI thread
+            logger.warning("OCR job cancelled because the OCR engine was shut down")
+            return
         try:
-            img_np = np.array(img)
-            # Refresh paths/keys
-            self.path_manager = PathManager()
-            self.tesseract_path = self.path_manager.get_tesseract_path
-            self.gemini_api_key = self.path_manager.get_gemini_api_key
+            text = future.result()
+        except Exception as e:
+            logger.error("Error during OCR: %s", e)
+            text = ""
+        self.text_extracted.emit(snippet_time, text)
+
+    def handle_extracted_text(self, snippet_time, text):
+        """
+        Copy the extracted text and pass it on to the main window.
+        """
+        logger.debug("Extracted %d chars", len(text))
+        if text:
+            pc.copy(text)
+        if self.parent:
+            self.parent.update_snip_results(text, snippet_time)
 
+    def get_ocr_scheduler(self):
+        """
+        Return the cached OCR scheduler for the current engine, building it on first use.
+        """
+        key = self._engine_key(self.ocr_engine)
+        scheduler = self._engines.get(key)
+        if scheduler is None:
             if self.ocr_engine == 'tesseract':
-                ocr_processor = TesseractOCR(tesseract_path=self.tesseract_path)
-                text = ocr_processor.extract_text(img_np, self.language)
+                tesseract_path = self.tesseract_path
+                binarize = os.getenv('TESSERACT_BINARIZE', 'False').lower() == 'true'
+                scheduler = OCRScheduler(
+                    lambda: TesseractOCR(tesseract_path=tesseract_path, binarize=binarize))
             elif self.ocr_engine == 'gemini':
-                ocr_processor = GeminiOCR()
-                text = ocr_processor.extract_text(img, self.language)
+                scheduler = OCRScheduler(GeminiOCR)
             else:
-                text = ""
-            
-            print("Extracted text:", text)
-            pc.copy(text)
-        except Exception as e:
-            print("Error during OCR:", e)
-            text = ""
+                raise ValueError(f"Unknown OCR engine: {self.ocr_engine}")
+            self._engines[key] = scheduler
+        return scheduler
 
-        if self.parent:
-            self.parent.update_snip_results(text)
+    def _engine_key(self, engine):
+        """Cache key for an engine; only Tesseract depends on the configured path."""
+        return (engine, self.tesseract_path if engine == 'tesseract' else None)
 
-        if self.parent:
-            self.parent.show()
-            self.parent.raise_()
-            self.parent.activateWindow()
-        self.hide()
+    def _bind_ocr_call(self):
+        """
+        Bind the per-snip OCR call to the current scheduler and language, so a
+        snip only has to submit its image.
+        """
+        scheduler = self.get_ocr_scheduler()
+        language = self.language
+        self._ocr_call = lambda img: scheduler.add_job(img, language)
 
-    def set_ocr_engine(self, engine, language):
-        """Set the OCR engine and language."""
+    def terminate_ocr(self):
+        """Stop all OCR schedulers and release their workers."""
+        for scheduler in self._engines.values():
+            scheduler.terminate()
+        self._engines.clear()
+
+    def set_ocr_engine(self, engine, language, tesseract_path=None):
+        """
+        Set the OCR engine and language, dropping only cached engines whose
+        configuration is out of date.
+        """
         self.ocr_engine = engine
         self.language = language
+        if tesseract_path:
+            self.tesseract_path = tesseract_path
+        for key in list(self._engines):
+            if key != self._engine_key(key[0]):
+                self._engines.pop(key).terminate()
+        self._bind_ocr_call()
 
 
 class SnipResultItem(QWidget):
@@ -205,10 +334,11 @@ class SnipResultItem(QWidget):
     Custom widget to represent a single snip result with time, text, 
     and copy/delete buttons.
     """
-    def __init__(self, snippet_time, snippet_text, parent=None):
+    def __init__(self, snippet_time, snippet_text, menu, parent=None):
         super().__init__(parent)
         self.snippet_text = snippet_text
         self.snippet_time = snippet_time
+        self._menu = menu
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
@@ -234,16 +364,11 @@ class SnipResultItem(QWidget):
 
     def copy_text(self):
         pc.copy(self.snippet_text)
-        print("Snippet copied to clipboard.")
+        logger.debug("Snippet copied to clipboard.")
 
     def delete_text(self):
-        # Navigate up to the parent Menu and call delete_snip_result
-        parent_menu = self.parentWidget()
-        while parent_menu and not isinstance(parent_menu, Menu):
-            parent_menu = parent_menu.parentWidget()
-        if parent_menu:
-            parent_menu.delete_snip_result(self.snippet_time)
-        print("Snippet deleted.")
+        self._menu.delete_snip_result(self.snippet_time)
+        logger.debug("Snippet deleted.")
 
 
 class Menu(QMainWindow):
@@ -252,6 +377,9 @@ class Menu(QMainWindow):
     Manages OCR settings, snip results, and UI components.
     """
     default_title = "OCR Snipping Tool"
+    snip_results_file = 'snip_results.jsonl'
+    legacy_snip_results_file = 'snip_results.json'
+    compact_every = 100
 
     def __init__(self, numpy_image=None, snip_number=None, start_position=(1200, 600, 800, 600)):
         super().__init__()
@@ -261,6 +389,9 @@ class Menu(QMainWindow):
         self.setGeometry(*start_position)
 
         self.total_snips = 0
+        self._snip_results = OrderedDict()
+        self._snip_items = {}
+        self._log_writes = 0
         self.ocr_engine = 'tesseract'
         self.language = 'eng'
 
@@ -271,6 +402,7 @@ class Menu(QMainWindow):
             self.image = self.convert_numpy_img_to_qpixmap(numpy_image)
         else:
             self.image = QPixmap("background.PNG")
+        self._scaled_image = self.image
 
         # Snipping tool instance
         self.snippingTool = SnippingWidget(parent=self)
@@ -411,20 +543,8 @@ class Menu(QMainWindow):
         # Language Selection
         layout.addWidget(QLabel("Select Language:"))
         self.language_selector = QComboBox()
-        languages = {
-            'English': 'eng',
-            'Bangla': 'ben',
-            'Hindi': 'hin',
-            'Japanese': 'jpn',
-            'Spanish': 'spa',
-            'French': 'fra',
-            'German': 'deu',
-            'Chinese (Simplified)': 'chi_sim',
-            'Russian': 'rus',
-            'Arabic': 'ara'
-        }
-        self.languages = languages
-        self.language_selector.addItems(languages.keys())
+        for name, code in LANGUAGES:
+            self.language_selector.addItem(name, code)
         self.language_selector.setCurrentText("English")
         layout.addWidget(self.language_selector)
 
@@ -457,36 +577,47 @@ class Menu(QMainWindow):
         Draw background image.
         """
         painter = QPainter(self)
-        rect = QRect(0, 0, self.image.width(), self.image.height())
-        painter.drawPixmap(rect, self.image)
+        painter.drawPixmap(0, 0, self._scaled_image)
+
+    def resizeEvent(self, event):
+        """
+        Rescale the background image once per resize rather than on every paint.
+        """
+        if not self.image.isNull():
+            self._scaled_image = self.image.scaled(
+                self.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        super().resizeEvent(event)
 
     def closeEvent(self, event):
+        self.snippingTool.terminate_ocr()
         event.accept()
 
     @staticmethod
     def convert_numpy_img_to_qpixmap(np_img):
         """
-        Convert a NumPy image array to QPixmap.
+        Convert an RGB NumPy image array to QPixmap.
         """
+        np_img = np.ascontiguousarray(np_img)
         height, width, channel = np_img.shape
         bytesPerLine = 3 * width
-        return QPixmap(QImage(np_img.data, width, height, bytesPerLine, QImage.Format_RGB888).rgbSwapped())
+        qimg = QImage(np_img.data, width, height, bytesPerLine, QImage.Format_RGB888)
+        # The QImage only borrows np_img's buffer, so detach before np_img can be freed
+        return QPixmap.fromImage(qimg.copy())
 
     def set_ocr_engine(self, engine, language):
         """Set OCR engine and language both locally and in the snipping tool."""
         self.ocr_engine = engine
         self.language = language
-        self.snippingTool.set_ocr_engine(engine, language)
+        self.snippingTool.set_ocr_engine(engine, language, self.tesseract_path_input.text())
 
-    def save_paths(self):
+    def get_path_settings(self):
         """
-        Save Tesseract path and Gemini API key to the .env file via the config manager.
+        Return the Tesseract path and Gemini API key from the input fields as .env settings.
         """
-        tesseract_path = self.tesseract_path_input.text()
-        gemini_api_key = self.gemini_api_key_input.text()
-        self.config_manager.set('TESSERACT_PATH', tesseract_path)
-        self.config_manager.set('GOOGLE_API_KEY', gemini_api_key)
-        print("Paths saved successfully.")
+        return {
+            'TESSERACT_PATH': self.tesseract_path_input.text(),
+            'GOOGLE_API_KEY': self.gemini_api_key_input.text(),
+        }
 
     def load_existing_paths(self):
         """
@@ -497,69 +628,153 @@ class Menu(QMainWindow):
         self.tesseract_path_input.setText(tesseract_path)
         self.gemini_api_key_input.setText(gemini_api_key)
 
-    def update_snip_results(self, text):
+    def update_snip_results(self, text, snippet_time=None):
         """
-        Update the snip results list and save them if enabled.
+        Add the new snip result to the list and save it if enabled. Results can
+        finish out of order, so the row is placed by its snip time.
         """
-        self.show()
         self.extracted_text_label.setText(text)
-        self.raise_()
-        self.activateWindow()
-
-        snip_results = self.load_snip_results()
+        # A late result must not steal focus from a snip that is in progress
+        if not SnippingWidget.is_snipping:
+            self.show()
+            self.raise_()
+            self.activateWindow()
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        snip_results[current_time] = text
+        current_time = snippet_time or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         save_text = self.config_manager.get('SAVE_TEXT', 'True').lower() == 'true'
         old_text_limit = int(self.config_manager.get('OLD_TEXT_LIMIT', '10'))
 
+        self.remove_snip_item(current_time)
+        self.add_snip_item(current_time, text, row=self._snip_row_for(current_time))
         if save_text:
-            # Maintain limit of old texts
-            if len(snip_results) > old_text_limit:
-                oldest_key = list(snip_results.keys())[0]
-                del snip_results[oldest_key]
-            self.save_snip_results(snip_results)
+            self._snip_results[current_time] = text
+            self._snip_results.move_to_end(current_time)
+            self._append_snip(current_time, text)
 
-        self.load_items_into_list(snip_results)
+        # Maintain limit of shown texts, dropping the oldest rows from the bottom
+        while self.snip_results_list.count() > old_text_limit:
+            oldest_item = self.snip_results_list.item(self.snip_results_list.count() - 1)
+            self.remove_snip_item(self.snip_results_list.itemWidget(oldest_item).snippet_time)
+
+        # Saved texts are only trimmed when saving is on, so turning it off never loses history
+        if save_text:
+            while len(self._snip_results) > old_text_limit:
+                oldest_time, _ = self._snip_results.popitem(last=False)
+                self._append_tombstone(oldest_time)
 
     def load_existing_snip_results(self):
         """
-        Load existing snip results from JSON and show them in the UI.
+        Load existing snip results from the log, compact it and show them in the UI.
         """
-        try:
-            snip_results = self.load_snip_results()
-            self.load_items_into_list(snip_results)
-        except FileNotFoundError:
-            pass
+        self._snip_results = self.load_snip_results()
+        self.compact_snip_results()
+        self.load_items_into_list(self._snip_results)
 
     def load_snip_results(self):
-        """Load snip results from the JSON file."""
+        """
+        Load the most recent snip results by replaying the JSONL log.
+        Falls back to the older single-file JSON format if there is no log yet.
+        """
+        snip_results = OrderedDict()
         try:
-            with open('snip_results.json', 'r') as f:
-                return json.load(f)
+            with open(Menu.snip_results_file, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Skip a line left half-written by a crash
+                        continue
+                    # Skip records that are valid JSON but not snips or tombstones
+                    if not isinstance(record, dict) or not isinstance(record.get('t'), str):
+                        continue
+                    snippet_time = record['t']
+                    if record.get('d'):
+                        snip_results.pop(snippet_time, None)
+                    elif isinstance(record.get('x'), str):
+                        snip_results.pop(snippet_time, None)
+                        snip_results[snippet_time] = record['x']
         except FileNotFoundError:
-            return {}
+            try:
+                with open(Menu.legacy_snip_results_file, 'r') as f:
+                    snip_results = json.load(f, object_pairs_hook=OrderedDict)
+            except FileNotFoundError:
+                pass
+
+        old_text_limit = int(self.config_manager.get('OLD_TEXT_LIMIT', '10'))
+        while len(snip_results) > old_text_limit:
+            snip_results.popitem(last=False)
+        return snip_results
 
-    def save_snip_results(self, snip_results):
-        """Save snip results to the JSON file."""
+    def _append_snip_record(self, record):
+        """Append a single record to the snip results log."""
         try:
-            with open('snip_results.json', 'w') as f:
-                json.dump(snip_results, f, indent=4)
+            with open(Menu.snip_results_file, 'a') as f:
+                f.write(json.dumps(record) + "\n")
         except Exception as e:
-            print("Error saving snip results:", e)
+            logger.error("Error saving snip results: %s", e)
+            return
+
+        self._log_writes += 1
+        if self._log_writes >= Menu.compact_every:
+            self.compact_snip_results()
+
+    def _append_snip(self, snippet_time, snippet_text):
+        self._append_snip_record({"t": snippet_time, "x": snippet_text})
+
+    def _append_tombstone(self, snippet_time):
+        self._append_snip_record({"t": snippet_time, "d": True})
+
+    def compact_snip_results(self):
+        """Rewrite the snip results log so it only holds the live results."""
+        tmp_file = Menu.snip_results_file + '.tmp'
+        try:
+            with open(tmp_file, 'w') as f:
+                for snippet_time, snippet_text in self._snip_results.items():
+                    f.write(json.dumps({"t": snippet_time, "x": snippet_text}) + "\n")
+            os.replace(tmp_file, Menu.snip_results_file)
+            self._log_writes = 0
+        except Exception as e:
+            logger.error("Error compacting snip results: %s", e)
 
     def load_items_into_list(self, snip_results):
         """
-        Load snip result items into the QListWidget.
+        Load snip result items into the QListWidget, newest first.
         """
         self.snip_results_list.clear()
-        for snippet_time, snippet_text in snip_results.items():
-            item_widget = SnipResultItem(snippet_time, snippet_text)
-            list_item = QListWidgetItem(self.snip_results_list)
-            list_item.setSizeHint(item_widget.sizeHint())
+        self._snip_items = {}
+        for snippet_time, snippet_text in reversed(snip_results.items()):
+            self.add_snip_item(snippet_time, snippet_text)
+
+    def add_snip_item(self, snippet_time, snippet_text, row=None):
+        """
+        Add a single snip result row, appending it unless a row is given.
+        """
+        item_widget = SnipResultItem(snippet_time, snippet_text, self)
+        list_item = QListWidgetItem()
+        list_item.setSizeHint(item_widget.sizeHint())
+        if row is None:
             self.snip_results_list.addItem(list_item)
-            self.snip_results_list.setItemWidget(list_item, item_widget)
+        else:
+            self.snip_results_list.insertItem(row, list_item)
+        self.snip_results_list.setItemWidget(list_item, item_widget)
+        self._snip_items[snippet_time] = list_item
+
+    def _snip_row_for(self, snippet_time):
+        """Row that keeps the newest-first list ordered by snip time."""
+        for row in range(self.snip_results_list.count()):
+            item_widget = self.snip_results_list.itemWidget(self.snip_results_list.item(row))
+            if item_widget.snippet_time < snippet_time:
+                return row
+        return self.snip_results_list.count()
+
+    def remove_snip_item(self, snippet_time):
+        """
+        Remove the row for a snip result from the QListWidget, if it is shown.
+        """
+        list_item = self._snip_items.pop(snippet_time, None)
+        if list_item is not None:
+            self.snip_results_list.takeItem(self.snip_results_list.row(list_item))
 
     def update_ocr_mode(self):
         """
@@ -579,12 +794,8 @@ class Menu(QMainWindow):
         """
         Apply OCR settings from the UI to the configuration.
         """
-        # Save paths from input fields
-        self.save_paths()
-
         # Update language
-        selected_lang = self.languages.get(self.language_selector.currentText(), 'eng')
-        self.language = selected_lang
+        self.language = self.language_selector.currentData() or 'eng'
 
         # Update OCR Engine
         selected_mode = self.ocr_mode_selector.currentText().lower()
@@ -596,33 +807,38 @@ class Menu(QMainWindow):
         if not old_text_limit.isdigit():
             old_text_limit = '10'  # fallback
 
-        self.config_manager.set('SAVE_TEXT', str(save_text))
-        self.config_manager.set('OLD_TEXT_LIMIT', old_text_limit)
+        # Save paths from input fields along with the text settings in one write
+        settings = self.get_path_settings()
+        settings['SAVE_TEXT'] = save_text
+        settings['OLD_TEXT_LIMIT'] = old_text_limit
+        self.config_manager.set_many(settings)
 
-        print("OCR Settings Applied.")
-        print(f"OCR Engine: {self.ocr_engine}, Language: {self.language}")
+        logger.info("OCR Settings Applied.")
+        logger.info("OCR Engine: %s, Language: %s", self.ocr_engine, self.language)
 
     def delete_snip_result(self, snippet_time):
         """
-        Delete a specific snip result by time from JSON storage and update list.
+        Delete a specific snip result by time from the list and the snip results log.
         """
         try:
-            snip_results = self.load_snip_results()
-            if snippet_time in snip_results:
-                del snip_results[snippet_time]
-            self.save_snip_results(snip_results)
-            self.load_items_into_list(snip_results)
+            self.remove_snip_item(snippet_time)
+            if self._snip_results.pop(snippet_time, None) is not None:
+                self._append_tombstone(snippet_time)
         except Exception as e:
-            print("Error deleting snip result:", e)
+            logger.error("Error deleting snip result: %s", e)
 
     def copy_extracted_text(self):
         """Copy the currently displayed extracted text to the clipboard."""
         text = self.extracted_text_label.toPlainText()
         pc.copy(text)
-        print("Last extracted text copied to clipboard.")
+        logger.debug("Last extracted text copied to clipboard.")
 
 
 if __name__ == '__main__':
+    log_level = os.getenv('LOG_LEVEL', 'WARNING').upper()
+    if not isinstance(logging.getLevelName(log_level), int):
+        log_level = 'WARNING'
+    logging.basicConfig(level=log_level)
     app = QApplication(sys.argv)
     mainMenu = Menu()
     sys.exit(app.exec_())
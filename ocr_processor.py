@@ -1,16 +1,16 @@
 from PIL import Image
-import google.generativeai as genai
 from typing import Union
 import numpy as np
 import os
-from dotenv import load_dotenv
+import logging
 from path_manager import PathManager
 
+logger = logging.getLogger(__name__)
+
 class GeminiOCR:
     """A class to handle OCR operations using Google's Gemini Pro Vision API"""
     
     def __init__(self):
-        load_dotenv()  # Load environment variables from .env file
         self.api_key = self._get_api_key()
         self.model_name = 'gemini-1.5-pro'  # Use the correct model name
         self.initialize_api()
@@ -23,6 +23,8 @@ class GeminiOCR:
     
     def initialize_api(self) -> None:
         """Initialize the Gemini API with the API key"""
+        # Imported here since google.generativeai is slow to load and only needed for Gemini
+        import google.generativeai as genai
         genai.configure(api_key=self.api_key)
         self.model = genai.GenerativeModel(self.model_name)
     
@@ -47,26 +49,24 @@ class GeminiOCR:
             str: Extracted text from the image
         """
         try:
-            # Convert image to PIL format and save as PNG
+            # Convert image to PIL format; the SDK accepts PIL images directly
             pil_image = self.convert_to_pil_image(image)
-            pil_image.save('temp.png', 'PNG')
-            png_image = Image.open('temp.png')
             
             # Prepare the prompt for multilingual text extraction
             prompt = f"Whats written in this image in {language}. Give me only the OCR text."
             
             # Generate content using the model
-            response = self.model.generate_content([prompt, png_image])
+            response = self.model.generate_content([prompt, pil_image])
         
             # Extract and clean the text
             if response.text:
                 return response.text.strip()
             return ""
         except ValueError as ve:
-            print(f"Image conversion error: {str(ve)}")
+            logger.error("Image conversion error: %s", ve)
             raise
         except Exception as e:
-            print(f"Text extraction failed: {str(e)}")
+            logger.error("Text extraction failed: %s", e)
             raise
     
     def verify_connection(self) -> bool:
@@ -77,11 +77,12 @@ class GeminiOCR:
             bool: True if connection is successful, False otherwise
         """
         try:
+            import google.generativeai as genai
             # Test the API with a simple prompt
             test_model = genai.GenerativeModel('gemini-pro')  # Use text-only model for testing
             response = test_model.generate_content("Test connection")
             return True
         except Exception as e:
-            print(f"API connection verification failed: {str(e)}")
+            logger.error("API connection verification failed: %s", e)
             return False
 
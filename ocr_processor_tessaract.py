@@ -1,40 +1,117 @@
+import numpy as np
 import pytesseract
-from PIL import Image 
+from PIL import Image
 from path_manager import PathManager
 import os
+import logging
+
+try:
+    # tesserocr keeps the Tesseract engine (and its traineddata) loaded in memory
+    from tesserocr import PyTessBaseAPI, PSM, tesseract_version
+except ImportError:
+    PyTessBaseAPI = None
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+logger = logging.getLogger(__name__)
 
 class TesseractOCR:
     """A class to handle OCR operations using Tesseract"""
-    
-    def __init__(self, tesseract_path):
+
+    def __init__(self, tesseract_path, binarize=False):
         # Initialize PathManager
         self.path_manager = PathManager()
-        print("Path is ", tesseract_path)
+        logger.debug("Path is %s", tesseract_path)
+        # Otsu thresholding is opt-in; it can wipe out glyphs on mixed backgrounds
+        self.binarize = binarize
+        self.api = None
+        self.language = None
+        if PyTessBaseAPI is not None:
+            self.tessdata_dir = self._find_tessdata_dir(tesseract_path)
+            return
         if not os.path.exists(tesseract_path):
             raise FileNotFoundError(f"Tesseract executable not found at {tesseract_path}. Please check your installation.")
         pytesseract.pytesseract.tesseract_cmd = tesseract_path
 
-    def extract_text(self, image, language): 
+    @staticmethod
+    def _find_tessdata_dir(tesseract_path):
+        """Locate the tessdata folder next to the Tesseract executable, if any"""
+        if tesseract_path:
+            tessdata_dir = os.path.join(os.path.dirname(tesseract_path), 'tessdata')
+            if os.path.isdir(tessdata_dir):
+                return tessdata_dir
+        return None
+
+    def _get_api(self, language):
+        """Return the persistent Tesseract API, re-initialising only when the language changes"""
+        if self.api is None:
+            if self.tessdata_dir:
+                self.api = PyTessBaseAPI(path=self.tessdata_dir, lang=language, psm=PSM.AUTO)
+            else:
+                self.api = PyTessBaseAPI(lang=language, psm=PSM.AUTO)
+        elif language != self.language:
+            try:
+                if self.tessdata_dir:
+                    self.api.Init(path=self.tessdata_dir, lang=language)
+                else:
+                    self.api.Init(lang=language)
+                self.api.SetPageSegMode(PSM.AUTO)
+            except Exception:
+                # A failed Init leaves the API unusable, so rebuild it on the next call
+                self.close()
+                raise
+        self.language = language
+        return self.api
+
+    @staticmethod
+    def preprocess(image, binarize=False):
+        """Convert an RGB(A) image to grayscale, optionally binarised with Otsu when OpenCV is available"""
+        if image.ndim == 3:
+            image = (0.299 * image[..., 0] + 0.587 * image[..., 1] + 0.114 * image[..., 2]).astype(np.uint8)
+        if binarize and cv2 is not None and image.size:
+            _, image = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        return image
+
+    def extract_text(self, image, language):
         """Extract text from the given image using Tesseract"""
         try:
-            print("Lang is : ", language)
-            pil_image = Image.fromarray(image)
-            # Set the language for Tesseract
-            text = pytesseract.image_to_string(pil_image, lang=language) 
+            logger.debug("Lang is %s", language)
+            pil_image = Image.fromarray(self.preprocess(image, self.binarize))
+            if PyTessBaseAPI is not None:
+                api = self._get_api(language)
+                api.SetImage(pil_image)
+                text = api.GetUTF8Text()
+            else:
+                # Set the language for Tesseract
+                text = pytesseract.image_to_string(pil_image, lang=language)
             return text.strip()
         except Exception as e:
-            print(f"OCR Error: {str(e)}")
+            logger.error("OCR Error: %s", e)
             return ""
 
+    def close(self):
+        """Release the persistent Tesseract API, if one was created"""
+        if self.api is not None:
+            self.api.End()
+            self.api = None
+            self.language = None
+
     def verify_tesseract(self):
         """Verify Tesseract installation and configuration"""
+        if PyTessBaseAPI is not None:
+            logger.info("Tesseract version: %s", tesseract_version())
+            logger.info("Using tessdata path: %s", self.tessdata_dir)
+            return True
         try:
             # Try to get Tesseract version
             version = pytesseract.get_tesseract_version()
-            print(f"Tesseract version: {version}")
-            print(f"Using Tesseract path: {pytesseract.pytesseract.tesseract_cmd}")
+            logger.info("Tesseract version: %s", version)
+            logger.info("Using Tesseract path: %s", pytesseract.pytesseract.tesseract_cmd)
             return True
         except Exception as e:
-            print(f"Tesseract verification failed: {str(e)}")
-            print(f"Current Tesseract path: {pytesseract.pytesseract.tesseract_cmd}")
-            return False
\ No newline at end of file
+            logger.error("Tesseract verification failed: %s", e)
+            logger.error("Current Tesseract path: %s", pytesseract.pytesseract.tesseract_cmd)
+            return False
@@ -0,0 +1,81 @@
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+class OCRScheduler:
+    """A class to run OCR jobs on a pool of persistent OCR workers"""
+
+    def __init__(self, worker_factory: Callable[[], Any], num_workers: int = 2):
+        """
+        Args:
+            worker_factory: Callable that builds one OCR processor (TesseractOCR, GeminiOCR, ...)
+            num_workers: Maximum number of jobs running at the same time
+        """
+        self.worker_factory = worker_factory
+        self.num_workers = num_workers
+        self.executor = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix='ocr')
+        self._idle_workers = queue.Queue()
+        self._workers = []
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+
+    def _acquire_worker(self):
+        """Take an idle worker, building a new one while the pool is not full"""
+        try:
+            return self._idle_workers.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._workers) < self.num_workers:
+                worker = self.worker_factory()
+                self._workers.append(worker)
+                return worker
+        return self._idle_workers.get()
+
+    def _run_job(self, image, language: str) -> str:
+        worker = self._acquire_worker()
+        try:
+            return worker.extract_text(image, language)
+        finally:
+            self._idle_workers.put(worker)
+
+    def add_job(self, image, language: str) -> Future:
+        """
+        Queue an OCR job
+
+        Args:
+            image: Input image in the form the worker's extract_text expects
+            language: Selected language for OCR
+
+        Returns:
+            Future: Resolves to the extracted text
+        """
+        future = self.executor.submit(self._run_job, image, language)
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._discard_pending)
+        return future
+
+    def _discard_pending(self, future: Future) -> None:
+        with self._pending_lock:
+            self._pending.discard(future)
+
+    def terminate(self) -> None:
+        """
+        Cancel queued jobs and release all workers once the running ones finish.
+        Returns immediately; the cleanup happens on a background thread.
+        """
+        with self._pending_lock:
+            pending = list(self._pending)
+        for future in pending:
+            future.cancel()
+        threading.Thread(target=self._shutdown, name='ocr-shutdown', daemon=True).start()
+
+    def _shutdown(self) -> None:
+        self.executor.shutdown(wait=True)
+        for worker in self._workers:
+            if hasattr(worker, 'close'):
+                worker.close()
+        self._workers = []
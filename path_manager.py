@@ -1,6 +1,5 @@
 import os
-from dotenv import load_dotenv
-import google.generativeai as genai
+from dotenv import dotenv_values
 
 
 class PathManager:
@@ -9,23 +8,32 @@ class PathManager:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(PathManager, cls).__new__(cls)
-            cls._instance._initialize()
+            try:
+                cls._instance._initialize()
+            except Exception:
+                # Don't cache a half-initialized instance; retry on next use
+                cls._instance = None
+                raise
         return cls._instance
     
     def _initialize(self):
-        load_dotenv()
+        # Read .env once; environment variables still take precedence
+        env_values = dotenv_values('.env', interpolate=False)
         
         # Get paths from environment variables or set default paths if not provided
-        self.tesseract_path = os.getenv('TESSERACT_PATH')  
-        self.gemini_api_key = os.getenv('GOOGLE_API_KEY')
+        self.tesseract_path = os.getenv('TESSERACT_PATH', env_values.get('TESSERACT_PATH'))
+        self.gemini_api_key = os.getenv('GOOGLE_API_KEY', env_values.get('GOOGLE_API_KEY'))
         
         # Validate paths
         self._validate_paths()
         
-        self.api_key = self._get_api_key()
-        genai.configure(api_key=self.api_key)
+        # genai.configure is left to GeminiOCR so Tesseract-only users never import it
+        self.api_key = self.gemini_api_key
     
     def _validate_paths(self):
+        # Nothing to check until the user has set a Tesseract path
+        if not self.tesseract_path:
+            return
         # Check if paths exist
         if not os.path.exists(self.tesseract_path):
             raise FileNotFoundError(f"Tesseract executable not found at: {self.tesseract_path}")
@@ -42,11 +50,3 @@ class PathManager:
         with open('.env', 'a') as f:
             f.write(f'TESSERACT_PATH={tesseract_path}\n')
             f.write(f'GOOGLE_API_KEY={gemini_api_key}\n')
-    
-    def _get_api_key(self):
-        with open('.env', 'r') as f:
-            for line in f:
-                if line.startswith('GOOGLE_API_KEY='):
-                    return line.split('=')[1].strip()
-        return None
-    
\ No newline at end of file